@@ -8,6 +8,41 @@ import time
 
 __VERSION__ = "1.0a.dev3"
 
+_IS_WINDOWS = platform.system() == "Windows"
+
+_SEP = os.sep
+_JOIN = os.path.join
+_ABSPATH = os.path.abspath
+_EXPANDUSER = os.path.expanduser
+_ISFILE = os.path.isfile
+_ISDIR = os.path.isdir
+_SPLITEXT = os.path.splitext
+_STAT = os.stat
+_SCANDIR = os.scandir
+
+if _IS_WINDOWS:
+    import ctypes
+
+    # Private handle, so prototypes set here don't leak into ctypes.windll
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = (ctypes.c_wchar_p,)
+    _GetFileAttributesW.restype = ctypes.c_uint32
+    _SetFileAttributesW = _kernel32.SetFileAttributesW
+    _SetFileAttributesW.argtypes = (ctypes.c_wchar_p, ctypes.c_uint32)
+    _SetFileAttributesW.restype = ctypes.c_int
+    _GetLogicalDrives = _kernel32.GetLogicalDrives
+    _GetLogicalDrives.restype = ctypes.c_uint32
+    _INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+    def _set_file_attributes(path, attributes):
+        if not _SetFileAttributesW(path, attributes):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+_HIDDEN = stat.FILE_ATTRIBUTE_HIDDEN
+_READONLY = stat.FILE_ATTRIBUTE_READONLY
+_NORMAL = stat.FILE_ATTRIBUTE_NORMAL
+
 
 class Path(os.PathLike):
     """
@@ -27,7 +62,8 @@ class Path(os.PathLike):
     path
 
     """
-    _separator = os.sep
+    _separator = _SEP
+    _disk_usage_ttl = 1.0
 
     def __init__(self, *args, expandvars=True):
         if len(args) == 0:
@@ -35,9 +71,24 @@ class Path(os.PathLike):
         if str(args[0]).endswith(":"):
             args = list(args)
             args[0] = args[0] + self._separator
-        self.__path = os.path.join(*args)
-        if expandvars:
+        self.__path = _JOIN(*args)
+        if expandvars and (isinstance(self.__path, bytes)
+                           or "$" in self.__path or "%" in self.__path):
             self.__path = os.path.expandvars(self.__path)
+        self.__abs = _ABSPATH(self.__path)
+
+    @classmethod
+    def _from_trusted(cls, path, abs_path=None):
+        """
+        Creates path object from an already expanded path string
+        without joining, expanding variables and resolving it again.
+
+        abs_path - known absolute form of path, if omitted path must be absolute
+        """
+        obj = object.__new__(cls)
+        obj.__path = path
+        obj.__abs = path if abs_path is None else abs_path
+        return obj
 
     @staticmethod
     def separator():
@@ -50,7 +101,7 @@ class Path(os.PathLike):
         """
         Returns absolute path of current path
         """
-        return Path(os.path.abspath(self.path))
+        return Path._from_trusted(self.__abs)
 
     @classmethod
     def cwd(cls):
@@ -64,34 +115,35 @@ class Path(os.PathLike):
         """
         Returns current user home directory path object
         """
-        return cls(os.path.expanduser("~"))
+        return cls(_EXPANDUSER("~"))
 
     @classmethod
     def home(cls):
         """
         Returns current user home directory path object
         """
-        return cls(os.path.expanduser("~"))
+        return cls(_EXPANDUSER("~"))
 
     def __fspath__(self):
-        return self.path
+        return self.__path
 
     @classmethod
-    def currentfile_path(cls, globalvars=globals()):
+    def currentfile_path(cls, globalvars=None):
         """
         Returns a current execution file (like jpg, zip and etc.)
         If it is not possible returns current directory path
 
         The method does not guarantee the correct result.
-        It is recommended to call passing in arguments globals()
+        If globalvars is not passed, the caller's globals are used
 
         The method works based on checking the contents of the global variable __file__
 
-        Good example: Path.currentfile_path(globalvars=globals())
-        Bad example (undefined behaviour):  Path.currentfile_path()
+        Example: Path.currentfile_path() or Path.currentfile_path(globalvars=globals())
         """
+        if globalvars is None:
+            globalvars = sys._getframe(1).f_globals
         if "__file__" in globalvars:
-            return cls(__file__)
+            return cls(globalvars["__file__"])
         else:
             return cls(os.getcwd())
 
@@ -100,42 +152,48 @@ class Path(os.PathLike):
         Test whether a path is a symbolic link.
         This will always return false for Windows prior to 6.0
         """
-        return os.path.islink(self.path)
+        return os.path.islink(self.__abs)
 
     def is_mount(self):
         """
         Test whether a path is a mount point
         (a drive root, the root of a share, or a mounted volume)
         """
-        return os.path.ismount(self.path)
+        return os.path.ismount(self.__abs)
 
     def split(self):
         """
         Returns a tuple of hierarchical elements of path
         """
-        return self.path.split(os.sep)
+        return self.path.split(_SEP)
 
     def get_canonical(self):
         """
         Returns string representation of the canonical path of current path object
         """
-        return os.path.realpath(self.path)
+        return os.path.realpath(self.__abs)
 
     def get_canonical_path(self):
         """
         Returns path object representation of the canonical path of current path object
         """
-        return Path(self.get_canonical())
+        return Path._from_trusted(self.get_canonical())
 
     def get_ext(self):
+        """
+        Returns the extension of current path (str), if path has no extension - returns None
+        """
+        return _SPLITEXT(self.__path)[1] or None
+
+    def get_ext_if_file(self):
         """
         Returns the extension of current path (str), if not file - returns None
         """
-        if (self.is_file()):
-            return os.path.splitext(self.path)[1]
+        if self.is_file():
+            return _SPLITEXT(self.__path)[1]
 
     def __str__(self):
-        return self.path
+        return self.__path
 
     def __repr__(self):
         return "<Path: {}>".format(self.name)
@@ -144,13 +202,13 @@ class Path(os.PathLike):
         """
         Tests whether the path is a normal file.
         """
-        return os.path.isfile(self.path)
+        return _ISFILE(self.__abs)
 
     def is_dir(self):
         """
         Tests whether the path is a directory.
         """
-        return os.path.isdir(self.path)
+        return _ISDIR(self.__abs)
 
     def open(self, *args, **kwargs):
         """
@@ -159,33 +217,35 @@ class Path(os.PathLike):
 
         Example: path.open("w", encoding="utf-8")
         """
-        return open(self.get_absolute(), *args, **kwargs)
+        return open(self.__abs, *args, **kwargs)
 
     def can_read(self):
         """
         Tests whether the application can read the file by this abstract pathname
         """
-        return os.access(self.get_absolute(), os.R_OK)
+        return os.access(self.__abs, os.R_OK)
 
     def can_execute(self):
         """
         Tests whether the application can execute the file by this abstract pathname
         """
-        return os.access(self.get_absolute(), os.X_OK)
+        return os.access(self.__abs, os.X_OK)
 
     def can_write(self):
         """
         Tests whether the application can write the file by this abstract pathname
         """
-        return os.access(self.get_absolute(), os.W_OK)
+        return os.access(self.__abs, os.W_OK)
 
-    def set_last_modified(self, time=time.time()):
+    def set_last_modified(self, mtime=None):
         """
         Sets the last-modified and last-accessed time of the path.
 
-        time - UNIX-time seconds (int or float)
+        mtime - UNIX-time seconds (int or float), current time if None
         """
-        return os.utime(self, (time, time))
+        if mtime is None:
+            mtime = time.time()
+        return os.utime(self.__abs, (mtime, mtime))
 
     def set_readable(self, readable, owners_only=True):
         """
@@ -194,16 +254,10 @@ class Path(os.PathLike):
         If owners_only is true method sets only owner's read permission, else - everybody
         """
         arg = stat.S_IRUSR if owners_only else 0o444
-        if readable:
-            if self.can_read():
-                return
-            else:
-                self.chmod(self.stat().st_mode ^ arg)
-        else:
-            if not self.can_read():
-                return
-            else:
-                self.chmod(self.stat().st_mode ^ arg)
+        mode = self.stat().st_mode
+        new_mode = (mode | arg) if readable else (mode & ~arg)
+        if new_mode != mode:
+            self.chmod(new_mode)
 
     def set_writable(self, writable, owners_only=True):
         """
@@ -212,16 +266,10 @@ class Path(os.PathLike):
         If owners_only is true method sets only owner's write permission, else - everybody
         """
         arg = stat.S_IWUSR if owners_only else 0o222
-        if writable:
-            if self.can_write():
-                return
-            else:
-                self.chmod(self.stat().st_mode ^ arg)
-        else:
-            if not self.can_write():
-                return
-            else:
-                self.chmod(self.stat().st_mode ^ arg)
+        mode = self.stat().st_mode
+        new_mode = (mode | arg) if writable else (mode & ~arg)
+        if new_mode != mode:
+            self.chmod(new_mode)
 
     def set_executable(self, executable, owners_only=True):
         """
@@ -231,16 +279,10 @@ class Path(os.PathLike):
         else - everybody
         """
         arg = stat.S_IXUSR if owners_only else 0o111
-        if executable:
-            if self.can_execute():
-                return
-            else:
-                self.chmod(self.stat().st_mode ^ arg)
-        else:
-            if not self.can_execute():
-                return
-            else:
-                self.chmod(self.stat().st_mode ^ arg)
+        mode = self.stat().st_mode
+        new_mode = (mode | arg) if executable else (mode & ~arg)
+        if new_mode != mode:
+            self.chmod(new_mode)
 
     def set_readonly(self):
         """
@@ -248,10 +290,8 @@ class Path(os.PathLike):
         so that only read operations are allowed for owners, group,
         others.
         """
-        if platform.system() == "Windows":
-            import win32api
-            import win32con
-            win32api.SetFileAttributes(self.get_absolute(), win32con.FILE_ATTRIBUTE_READONLY)
+        if _IS_WINDOWS:
+            _set_file_attributes(self.__abs, _READONLY)
         else:
             self.chmod(0o444)
 
@@ -260,14 +300,24 @@ class Path(os.PathLike):
         Change the access permissions of a file. Wrapper for standard-library method
         os.chmod
         """
-        os.chmod(self, *args, **kwargs)
+        os.chmod(self.__abs, *args, **kwargs)
 
     def stat(self):
         """
         Perform a stat system call on the given path.
         Wrapper for standard-library method os.stat
         """
-        return os.stat(self)
+        return _STAT(self.__abs)
+
+    def _try_stat(self):
+        """
+        Performs a stat system call, returns None if path doesn't exist
+        or can't be accessed
+        """
+        try:
+            return _STAT(self.__abs)
+        except (OSError, ValueError):
+            return None
 
     def create_new_file(self):
         """
@@ -276,11 +326,9 @@ class Path(os.PathLike):
         false - if file exists or raised any exception
         """
         try:
-            if not self.exists():
-                self.open("w").close()
-                return True
-            else:
-                return False
+            fd = os.open(self.__abs, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            os.close(fd)
+            return True
         except Exception:
             return False
 
@@ -291,11 +339,8 @@ class Path(os.PathLike):
         false - if directory exists or raised any exception
         """
         try:
-            if not self.exists():
-                os.mkdir(self.get_absolute())
-                return True
-            else:
-                return False
+            os.mkdir(self.__abs)
+            return True
         except Exception:
             return False
 
@@ -305,9 +350,9 @@ class Path(os.PathLike):
         """
         try:
             if self.is_dir():
-                os.rmdir(self.get_absolute())
+                os.rmdir(self.__abs)
             else:
-                os.remove(self.get_absolute())
+                os.remove(self.__abs)
             return True
         except Exception:
             return False
@@ -318,9 +363,9 @@ class Path(os.PathLike):
         """
         try:
             if self.is_dir():
-                shutil.rmtree(self.get_absolute())
+                shutil.rmtree(self.__abs)
             else:
-                os.remove(self.get_absolute())
+                os.remove(self.__abs)
             return True
         except Exception:
             return False
@@ -329,7 +374,7 @@ class Path(os.PathLike):
         """
         Tests whether path exists
         """
-        return os.path.exists(self.get_absolute())
+        return os.path.exists(self.__abs)
 
     def is_absolute(self):
         """
@@ -343,9 +388,9 @@ class Path(os.PathLike):
         Copy file or directory from one path to another using standard-library
         method shutil.copy2
         """
-        path1 = path1.get_absolute()
-        path2 = path2.get_absolute()
-        return Path(shutil.copy2(path1, path2, follow_symlinks=symlinks))
+        path1 = path1.__abs
+        path2 = path2.__abs
+        return Path._from_trusted(shutil.copy2(path1, path2, follow_symlinks=symlinks))
 
     @staticmethod
     def rcopy(path1, path2, symlinks=False):
@@ -354,10 +399,10 @@ class Path(os.PathLike):
         to another using standard-library
         method shutil.copytree
         """
-        path1 = path1.get_absolute()
-        path2 = path2.get_absolute()
-        return Path(shutil.copytree(path1, path2, symlinks=symlinks,
-                                    copy_function=shutil.copy2))
+        path1 = path1.__abs
+        path2 = path2.__abs
+        return Path._from_trusted(shutil.copytree(path1, path2, symlinks=symlinks,
+                                                  copy_function=shutil.copy2))
 
     @staticmethod
     def move(path1, path2):
@@ -366,8 +411,8 @@ class Path(os.PathLike):
         to another using standard-library
         method shutil.copytree
         """
-        path1 = path1.get_absolute()
-        path2 = path2.get_absolute()
+        path1 = path1.__abs
+        path2 = path2.__abs
         shutil.move(path1, path2, copy_function=shutil.copy2)
 
     def list(self, full_path=False):
@@ -377,98 +422,123 @@ class Path(os.PathLike):
 
         If full_path returns tuple with absolute-path strings
         """
-        directory = os.listdir(self.get_absolute())
-        if full_path:
-            for i in range(len(directory)):
-                directory[i] = os.path.join(self.get_absolute(), directory[i])
-        return tuple(directory)
+        with _SCANDIR(self.__abs) as it:
+            if full_path:
+                return tuple(entry.path for entry in it)
+            return tuple(entry.name for entry in it)
+
+    def iter_files(self):
+        """
+        Returns an iterator of abstract pathnames with files denoted
+        by this abstract pathname. Directory entries are read lazily.
+        """
+        with _SCANDIR(self.__abs) as it:
+            for entry in it:
+                if entry.is_file():
+                    yield Path._from_trusted(entry.path)
+
+    def iter_dirs(self):
+        """
+        Returns an iterator of abstract pathnames with directories
+        denoted by this abstract pathname. Directory entries are read lazily.
+        """
+        with _SCANDIR(self.__abs) as it:
+            for entry in it:
+                if entry.is_dir():
+                    yield Path._from_trusted(entry.path)
+
+    def iter_paths(self):
+        """
+        Returns an iterator of abstract pathnames with files and dirs
+        denoted by this abstract pathname. Directory entries are read lazily.
+        """
+        with _SCANDIR(self.__abs) as it:
+            for entry in it:
+                yield Path._from_trusted(entry.path)
 
     def list_files(self):
         """
         Returns a tuple of abstract pathnames with files denoted
         by this abstract pathname.
         """
-        directory = os.listdir(self.get_absolute())
-        files = []
-        for i in range(len(directory)):
-            directory[i] = Path(self.get_absolute(), directory[i])
-            if directory[i].is_file():
-                files.append(directory[i])
-        return tuple(files)
+        return tuple(self.iter_files())
 
     def list_dirs(self):
         """
         Returns a tuple of abstract pathnames with directories
         denoted by this abstract pathname.
         """
-        directory = os.listdir(self.get_absolute())
-        dirs = []
-        for i in range(len(directory)):
-            directory[i] = Path(self.get_absolute(), directory[i])
-            if directory[i].is_dir():
-                dirs.append(directory[i])
-        return tuple(dirs)
+        return tuple(self.iter_dirs())
 
     def list_paths(self):
         """
         Returns a tuple of abstract pathnames with files and dirs
         denoted by this abstract pathname.
         """
-        directory = os.listdir(self.get_absolute())
-        for i in range(len(directory)):
-            directory[i] = Path(self.get_absolute(), directory[i])
-        return tuple(directory)
+        return tuple(self.iter_paths())
 
     def get_root(self):
         """
         Returns the filesystem root.
         """
-        return Path(Path(self.get_absolute()).split()[0] + self.separator())
+        return Path._from_trusted(os.path.splitdrive(self.__abs)[0] + self._separator)
 
     def splitdrive(self):
         """
         Analog to os.path.splitdrive
         """
-        return Path(os.path.splitdrive(self.get_absolute())[0])
+        drive = os.path.splitdrive(self.__abs)[0]
+        if not drive:
+            return Path(drive)
+        if drive.endswith(":"):
+            drive += self._separator
+        return Path._from_trusted(drive)
 
     def get_relative(self):
         """
         Returns relative path string of current path
         """
-        return os.path.relpath(self.get_absolute())
+        return os.path.relpath(self.__abs)
 
     def get_relative_path(self):
         """
         Returns relative path of current path
         """
-        return Path(os.path.relpath(self.get_absolute()))
+        return Path._from_trusted(os.path.relpath(self.__abs), self.__abs)
 
     def is_hidden(self):
         """
         Tests whether the file named by this abstract pathname is a hidden file.
         In UNIX systems checks if filename starts with "."
         """
-        if platform.system() == 'Windows':
-            return bool(os.stat(self).st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+        if _IS_WINDOWS:
+            return bool(self._file_attributes() & _HIDDEN)
         else:
             return self.name.startswith(".")
 
+    def _file_attributes(self):
+        """
+        Returns Windows file attributes of the path using GetFileAttributesW,
+        falls back to os.stat if attributes can't be read this way
+        """
+        if isinstance(self.__abs, str):
+            attributes = _GetFileAttributesW(self.__abs)
+            if attributes != _INVALID_FILE_ATTRIBUTES:
+                return attributes
+        return _STAT(self.__abs).st_file_attributes
+
     def set_hidden(self, hidden):
         """
         Sets this path as hidden.
         In UNIX systems adds "." to to the beginning of the filename
         """
-        if platform.system() == 'Windows':
-            import win32api
-            import win32con
-            readonly = self.can_read()
+        if _IS_WINDOWS:
+            attributes = self._file_attributes()
             if hidden:
-                flag = win32con.FILE_ATTRIBUTE_HIDDEN
+                attributes |= _HIDDEN
             else:
-                flag = win32con.FILE_ATTRIBUTE_NORMAL
-            win32api.SetFileAttributes(self.get_absolute(), flag)
-            if readonly:
-                self.set_readonly()
+                attributes &= ~_HIDDEN
+            _set_file_attributes(self.__abs, attributes or _NORMAL)
         else:
             if hidden:
                 if not self.name.startswith("."):
@@ -479,77 +549,140 @@ class Path(os.PathLike):
 
     def norm_path(self):
         """
-        Normalizes the path using standard-library method os.path.normcase
-        and os.path.normpath
+        Normalizes the path using standard-library method os.path.normpath.
+        In Windows the path is also lowercased like os.path.normcase does.
+        The result is computed once and cached in the path object
         """
-        return Path(os.path.normcase(os.path.normpath(self)))
+        try:
+            return self.__norm
+        except AttributeError:
+            normalized = os.path.normpath(self.__path)
+            abs_path = self.__abs
+            if _IS_WINDOWS:
+                # normpath already replaced slashes, only the case is left
+                normalized = normalized.lower()
+                abs_path = abs_path.lower()
+            self.__norm = Path._from_trusted(normalized, abs_path)
+            return self.__norm
 
     @staticmethod
     def list_roots():
         """
         List the available filesystem roots.
         """
-        if sys.platform == "win32":
-            import win32api
-            drives = win32api.GetLogicalDriveStrings()
-            drives = drives.split('\000')[:-1]
-            for i in range(len(drives)):
-                drives[i] = Path(drives[i])
+        if _IS_WINDOWS:
+            mask = _GetLogicalDrives()
+            return [Path._from_trusted(chr(ord("A") + i) + ":" + _SEP)
+                    for i in range(26) if mask & (1 << i)]
         else:
-            return [Path("/")]
+            return [Path._from_trusted("/")]
 
     def __eq__(self, other):
-        return os.path.samefile(self, other)
+        """
+        Compares two path objects by their case-normalized absolute paths.
+        To compare with strings or other path-like objects use samefile
+        """
+        if not isinstance(other, Path):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        """
+        Returns comparison key of the path: case-normalized absolute path
+        """
+        if isinstance(self.__abs, int):
+            return self.__abs
+        return os.path.normcase(self.__abs)
+
+    def samefile(self, other):
+        """
+        Tests whether both paths refer to the same existing file
+        by comparing their device and inode numbers.
+        other may be a path object, a string or any path-like object.
+        Returns false if any of the paths doesn't exist
+        """
+        if not isinstance(other, Path):
+            other = Path(other, expandvars=False)
+        st = self._try_stat()
+        other_st = other._try_stat()
+        if st is None or other_st is None:
+            return False
+        return (st.st_dev, st.st_ino) == (other_st.st_dev, other_st.st_ino)
 
     @property
     def last_modified(self):
-        if self.exists():
-            return os.path.getmtime(self.get_absolute())
+        st = self._try_stat()
+        if st is not None:
+            return st.st_mtime
 
     @property
     def last_access(self):
-        if self.exists():
-            return os.path.getatime(self.get_absolute())
+        st = self._try_stat()
+        if st is not None:
+            return st.st_atime
 
     @property
     def ctime(self):
-        if self.exists():
-            return os.path.getctime(self.get_absolute())
+        st = self._try_stat()
+        if st is not None:
+            return st.st_ctime
 
     @property
     def creation_time(self):
-        if self.exists():
-            if platform.system() == 'Windows':
-                return os.path.getctime(self)
+        st = self._try_stat()
+        if st is not None:
+            if _IS_WINDOWS:
+                return st.st_ctime
             else:
-                stat = os.stat(self)
                 try:
-                    return stat.st_birthtime
+                    return st.st_birthtime
                 except AttributeError:
-                    return stat.st_mtime
+                    return st.st_mtime
 
     def __len__(self):
         return self.size
 
+    def disk_usage(self):
+        """
+        Returns disk usage statistics of the partition named by this abstract pathname
+        as a named tuple with attributes total, used and free.
+        Wrapper for standard-library method shutil.disk_usage
+
+        The result is cached in the path object for _disk_usage_ttl seconds
+        """
+        now = time.monotonic()
+        try:
+            checked, usage = self.__disk_usage
+            if now - checked < self._disk_usage_ttl:
+                return usage
+        except AttributeError:
+            pass
+        usage = shutil.disk_usage(self.get_root())
+        self.__disk_usage = (now, usage)
+        return usage
+
     def get_totalspace(self):
         """
         Returns the size of the partition named by this abstract pathname.
         """
-        return shutil.disk_usage(self.get_root())[0]
+        return self.disk_usage()[0]
 
     def get_usedspace(self):
         """
         Returns the number of bytes available on the partition named
         by this abstract pathname
         """
-        return shutil.disk_usage(self.get_root())[1]
+        return self.disk_usage()[1]
 
     def get_freespace(self):
         """
         Returns the number of unallocated bytes in the partition named
         by this abstract pathname.
         """
-        return shutil.disk_usage(self.get_root())[2]
+        return self.disk_usage()[2]
 
     @staticmethod
     def create_temp_file(*args, **kwargs):
@@ -588,12 +721,13 @@ class Path(os.PathLike):
     @property
     def name(self):
         if self.exists():
-            return os.path.split(self.get_absolute())[1]
+            return os.path.split(self.__abs)[1]
 
     @property
     def size(self):
-        if self.exists():
-            return os.stat(self.get_absolute()).st_size
+        st = self._try_stat()
+        if st is not None:
+            return st.st_size
 
     def mkdirs(self):
         """
@@ -601,11 +735,8 @@ class Path(os.PathLike):
         including any necessary but nonexistent parent directories.
         """
         try:
-            if not self.exists():
-                os.makedirs(self.get_absolute())
-                return True
-            else:
-                return False
+            os.makedirs(self.__abs)
+            return True
         except Exception:
             return False
 
@@ -614,24 +745,24 @@ class Path(os.PathLike):
         Returns the path of this abstract pathname's parent,
         or current path if this pathname does not name a parent directory.
         """
-        return Path(os.path.split(self.get_absolute())[0])
+        return Path._from_trusted(os.path.split(self.__abs)[0])
 
     def get_parent(self):
         """
         Returns the path of this abstract pathname's parent,
         or current path if this pathname does not name a parent directory.
         """
-        return os.path.split(self.get_absolute())[0]
+        return os.path.split(self.__abs)[0]
 
     def get_absolute(self):
         """
         Returns the absolute pathname string of this abstract pathname.
         """
-        return os.path.abspath(self.path)
+        return self.__abs
 
     def __iter__(self):
         if self.is_dir():
-            return iter(self.list_paths())
+            return self.iter_paths()
         else:
             raise OSError("File is not iterable")
 
@@ -642,7 +773,7 @@ class Path(os.PathLike):
         try:
             pth = self.get_parent()
             new = Path(pth, newname)
-            os.rename(self, new)
+            os.rename(self.__abs, new.__abs)
             return new
         except Exception:
             return None
@@ -675,11 +806,16 @@ class _TemporaryPath(Path):
 
     def __init__(self, tmp):
         self.__tmp = tmp
-        self.__path = tmp.name
+        self._Path__path = tmp.name
+        # Unnamed temporary files expose a file descriptor instead of a name
+        if isinstance(tmp.name, int):
+            self._Path__abs = tmp.name
+        else:
+            self._Path__abs = _ABSPATH(tmp.name)
 
     @property
     def path(self):
-        return self.__path
+        return self._Path__path
 
     def is_temp(self):
         return True